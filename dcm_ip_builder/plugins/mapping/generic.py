@@ -4,6 +4,7 @@ from typing import Any
 from pathlib import Path
 import base64
 from urllib import request
+from urllib.parse import urlparse
 import importlib
 import abc
 from hashlib import md5
@@ -256,8 +257,13 @@ class GenericUrlPlugin(GenericMappingPlugin):
         """Loads `GenericMapper`-class."""
         # read data from source url
         try:
-            with request.urlopen(src, timeout=10) as remote_file:
-                url_src = remote_file.read()
+            url = urlparse(src)
+            if url.scheme == "file" and url.netloc in ("", "localhost"):
+                # read local files directly (skips urllib's opener-setup)
+                url_src = Path(request.url2pathname(url.path)).read_bytes()
+            else:
+                with request.urlopen(src, timeout=10) as remote_file:
+                    url_src = remote_file.read()
         # pylint: disable=broad-exception-caught
         except Exception as exc_info:
             return False, f"cannot access url '{src}': {exc_info}", None
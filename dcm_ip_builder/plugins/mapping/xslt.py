@@ -1,9 +1,10 @@
 """Definition of the xslt-mapper plugin."""
 
-from typing import Any, Optional
+from typing import Optional
 from pathlib import Path
 import abc
 from io import StringIO
+from functools import lru_cache
 
 from lxml import etree as ET
 from dcm_common import LoggingContext as Context
@@ -12,6 +13,28 @@ from dcm_common.plugins import PythonDependency, Signature, Argument, JSONType
 from .interface import MappingPlugin, MappingPluginContext
 
 
+@lru_cache(maxsize=32)
+def _compile_xslt(src: str) -> tuple[ET.XSLT, tuple[str, ...]]:
+    """
+    Returns the compiled xsl-transformation `src` alongside the messages
+    of all errors that were logged during its initialization.
+
+    Results are cached since compiling a stylesheet is expensive compared
+    to applying it. The initialization errors are copied because the
+    `error_log` of an `ET.XSLT` is replaced with every application.
+
+    The stylesheet is passed to the parser as UTF-8-encoded bytes (this
+    also allows `src` to contain an XML-declaration with encoding). The
+    parser is explicitly set to UTF-8, such that a differing encoding
+    in that declaration does not cause non-ASCII characters to be
+    decoded incorrectly.
+    """
+    xslt = ET.XSLT(
+        ET.XML(src.encode("utf-8"), ET.XMLParser(encoding="utf-8"))
+    )
+    return xslt, tuple(str(e) for e in xslt.error_log)
+
+
 class XSLTMappingPlugin(MappingPlugin, metaclass=abc.ABCMeta):
     """
     Metadata mapping-plugin that works based on an xslt transformation
@@ -36,21 +59,27 @@ class XSLTMappingPlugin(MappingPlugin, metaclass=abc.ABCMeta):
         )
     )
 
-    def _load_xslt(self, src: str) -> tuple[bool, str, Any]:
+    def _load_xslt(
+        self, src: str
+    ) -> tuple[bool, str, Optional[ET.XSLT], tuple[str, ...]]:
+        """
+        Returns a tuple of success, message, and (if successful) the
+        compiled xslt and its initialization errors.
+        """
         try:
-            xslt = ET.XSLT(ET.XML(src))
+            xslt, init_errors = _compile_xslt(src)
         # pylint: disable=broad-exception-caught
         except Exception as exc_info:
-            return False, f"cannot process source: {exc_info}", None
-        return True, "", xslt
+            return False, f"cannot process source: {exc_info}", None, ()
+        return True, "", xslt, init_errors
 
-    def _validate_xslt(self, xslt: ET.XSLT) -> tuple[bool, str]:
-        if xslt.error_log:
+    def _validate_xslt(self, init_errors: tuple[str, ...]) -> tuple[bool, str]:
+        if init_errors:
             return (
                 False,
                 (
                     "Provided 'XSLT' initialized with errors: "
-                    + "".join([str(e) + "\n" for e in xslt.error_log])
+                    + "".join([e + "\n" for e in init_errors])
                 )
             )
         return True, ""
@@ -87,52 +116,50 @@ class XSLTMappingPlugin(MappingPlugin, metaclass=abc.ABCMeta):
         and text for each element.
         """
         result = {}
-        for element in etree.iter():
-            # ignore root element
-            if element.getparent() is None:
-                continue
+        # only direct children of the 'metadata' root element need to be
+        # visited since nested elements are rejected altogether
+        for element in etree.getroot():
             # return error for nested elements
-            if list(element):
+            if len(element):
                 raise TypeError(
                         f"Element with tag '{element.tag}' and text "
                         + f"'{element.text}' can't have child elements "
                         + "with tags and text: "
-                        + f"{[(e.tag, e.text) for e in list(element)]}."
+                        + f"{[(e.tag, e.text) for e in element]}."
                 )
-            # only process direct children of 'metadata' root element
-            if element.getparent().tag == "metadata":
-                if element.tag != "field":
-                    raise TypeError(
-                        f"Element with text '{element.text}' has "
-                        + f"an unexpected tag '{element.tag}'. "
-                        + "Only 'field' is allowed."
-                    )
-                if "key" not in element.attrib:
-                    raise TypeError(
-                        f"Element with tag '{element.tag}' and text "
-                        + f"'{element.text}' is missing required attribute 'key'."
-                    )
-                additional_attributes = [
-                    a for a in element.attrib.keys() if a != "key"
-                ]
-                if additional_attributes:
-                    raise TypeError(
-                        f"""Attributes '{", ".join(additional_attributes)}' """
-                        + f"not allowed in element with tag '{element.tag}' "
-                        + f"and text '{element.text}'."
-                    )
-                key = element.attrib["key"]
-                value = element.text
-                if key in result:
-                    result[key].append(value)
-                else:
-                    result[key] = [value]
+            if element.tag != "field":
+                raise TypeError(
+                    f"Element with text '{element.text}' has "
+                    + f"an unexpected tag '{element.tag}'. "
+                    + "Only 'field' is allowed."
+                )
+            if "key" not in element.attrib:
+                raise TypeError(
+                    f"Element with tag '{element.tag}' and text "
+                    + f"'{element.text}' is missing required attribute "
+                    + "'key'."
+                )
+            additional_attributes = [
+                a for a in element.attrib.keys() if a != "key"
+            ]
+            if additional_attributes:
+                raise TypeError(
+                    f"""Attributes '{", ".join(additional_attributes)}' """
+                    + f"not allowed in element with tag '{element.tag}' "
+                    + f"and text '{element.text}'."
+                )
+            key = element.attrib["key"]
+            value = element.text
+            if key in result:
+                result[key].append(value)
+            else:
+                result[key] = [value]
         return result
 
     def _get(self, context: MappingPluginContext, /, **kwargs):
         context.set_progress("loading xslt from string")
         context.push()
-        xslt_ok, msg, xslt = self._load_xslt(kwargs["xslt"])
+        xslt_ok, msg, xslt, init_errors = self._load_xslt(kwargs["xslt"])
         if not xslt_ok:
             context.result.success = False
             context.result.log.log(
@@ -144,7 +171,7 @@ class XSLTMappingPlugin(MappingPlugin, metaclass=abc.ABCMeta):
 
         context.set_progress("validating xslt")
         context.push()
-        xslt_ok, msg = self._validate_xslt(xslt)
+        xslt_ok, msg = self._validate_xslt(init_errors)
         if not xslt_ok:
             context.result.success = False
             context.result.log.log(Context.ERROR, body=msg)
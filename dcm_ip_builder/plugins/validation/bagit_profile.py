@@ -2,6 +2,7 @@
 
 from typing import Optional, Mapping
 from pathlib import Path
+from threading import Lock
 
 import bagit_utils
 from dcm_common.plugins import (
@@ -66,6 +67,8 @@ class BagItProfilePlugin(ValidationPlugin):
         path=ValidationPlugin.signature.properties["path"],
         profile_url=ValidationPlugin.signature.properties["profile_url"],
     )
+    # maximum number of profiles (loaded from urls) kept in memory
+    _PROFILE_CACHE_SIZE = 16
 
     def __init__(
         self,
@@ -84,6 +87,47 @@ class BagItProfilePlugin(ValidationPlugin):
             ),
             profile=default_profile,
         )
+        self._profiles: dict[str, dict] = {}
+        self._profiles_lock = Lock()
+
+    def __getstate__(self):
+        # locks cannot be pickled
+        state = self.__dict__.copy()
+        del state["_profiles_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._profiles_lock = Lock()
+
+    def _load_profile(self, url: str) -> dict:
+        """
+        Returns BagIt-profile loaded from `url`. Successfully loaded
+        profiles are cached (the oldest entry is dropped once the cache
+        is full). Note that cached profiles are not reloaded, i.e.
+        changes to a profile at its url only take effect after its entry
+        has been dropped or the plugin has been re-instantiated.
+
+        The cache is shared between concurrent jobs; access is guarded
+        by a lock (the profile itself is loaded without holding it).
+
+        Keyword arguments:
+        url -- file path or url to the BagIt-profile
+        """
+        with self._profiles_lock:
+            profile = self._profiles.get(url)
+        if profile is None:
+            profile = bagit_utils.BagItProfileValidator.load_profile(
+                profile_src=url,
+            )
+            with self._profiles_lock:
+                if (
+                    url not in self._profiles
+                    and len(self._profiles) >= self._PROFILE_CACHE_SIZE
+                ):
+                    self._profiles.pop(next(iter(self._profiles)))
+                self._profiles[url] = profile
+        return profile
 
     @classmethod
     def _validate_more(cls, kwargs):
@@ -151,9 +195,7 @@ class BagItProfilePlugin(ValidationPlugin):
             context.set_progress("loading profile")
             context.push()
             try:
-                bagit_profile = bagit_utils.BagItProfileValidator.load_profile(
-                    profile_src=bagit_profile_url,
-                )
+                bagit_profile = self._load_profile(bagit_profile_url)
             # pylint: disable=broad-exception-caught
             except Exception as exc_info:
                 context.result.log.log(
@@ -25,6 +25,18 @@ class ValidationView(services.OrchestratedView):
 
     NAME = "ip-validation"
 
+    def __init__(self, config, *args, **kwargs) -> None:
+        super().__init__(config, *args, **kwargs)
+        # validation plugins in order of execution
+        self._validation_plugins = tuple(
+            (plugin_name, self.config.validation_plugins[plugin_name])
+            for plugin_name in [
+                "bagit-profile",
+                "payload-structure",
+                "significant-properties",
+            ]
+        )
+
     def register_job_types(self):
         self.config.worker_pool.register_job_type(
             self.NAME, self.validate, ValidationReport
@@ -132,33 +144,22 @@ class ValidationView(services.OrchestratedView):
         )
         context.push()
 
-        # Create validation_plugins with empty arguments
-        validation_plugins = {
-            plugin_name: {
-                "plugin": self.config.validation_plugins[plugin_name],
-                "args": {},
-            }
-            for plugin_name in [
-                "bagit-profile",
-                "payload-structure",
-                "significant-properties",
-            ]
-        }
+        # collect plugin-args from request (only profile urls are supported)
+        plugin_args = {}
         if _validation_config.bagit_profile_url:
             # Register any profile url from request
-            validation_plugins["bagit-profile"]["args"] = {
+            plugin_args["bagit-profile"] = {
                 "profile_url": _validation_config.bagit_profile_url
             }
         if _validation_config.payload_profile_url:
             # Register any profile url from request
-            validation_plugins["payload-structure"]["args"] = {
+            plugin_args["payload-structure"] = {
                 "profile_url": _validation_config.payload_profile_url
             }
 
         # iterate validation plugins
-        for config in validation_plugins.values():
+        for plugin_name, plugin in self._validation_plugins:
             # collect plugin-info
-            plugin = config["plugin"]
             info.report.progress.verbose = (
                 f"calling plugin '{plugin.display_name}'"
             )
@@ -179,10 +180,8 @@ class ValidationView(services.OrchestratedView):
             # run plugin logic
             plugin.get(
                 context,
-                **(
-                    {"path": str(_validation_config.target.path)}
-                    | config["args"]
-                ),
+                path=str(_validation_config.target.path),
+                **plugin_args.get(plugin_name, {}),
             )
             # Copy messages into main log
             info.report.log.merge(
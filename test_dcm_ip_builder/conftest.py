@@ -10,15 +10,65 @@ from dcm_ip_builder.config import AppConfig
 from dcm_ip_builder.plugins.mapping import DemoMappingPlugin
 
 
+# test-profiles used in testing_config
+TEST_BAGIT_PROFILE_URL = "https://lzv.nrw/test_bagit_profile.json"
+TEST_BAGIT_PROFILE = {
+    "BagIt-Profile-Info": {
+        "Source-Organization": "Some source organization",
+        "External-Description": "Some description",
+        "BagIt-Profile-Identifier": "https://lzv.nrw/test_bagit_profile.json",
+        "Version": "0.3.2"
+    },
+    "Bag-Info": {
+        "DC-Title": {
+            "required": True,
+            "repeatable": False
+        },
+        "BagIt-Profile-Identifier": {
+            "required": True,
+            "repeatable": False,
+            "description": "(https|http|sftp|file):\\/\\/\\S*"
+        },
+        "BagIt-Payload-Profile-Identifier": {
+            "required": True,
+            "repeatable": False,
+            "description": "(https|http|sftp|file):\\/\\/\\S*"
+        },
+        "Bag-Software-Agent": {
+            "required": False,
+            "repeatable": False,
+            "description": ".* v[\\w\\.\\-\\+]+"
+        },
+        "Bagging-DateTime": {
+            "required": True,
+            "repeatable": False,
+            "description": "(\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d:[0-5]\\d\\.\\d+([+-][0-2]\\d:[0-5]\\d|Z))|(\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d:[0-5]\\d([+-][0-2]\\d:[0-5]\\d|Z))|(\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d([+-][0-2]\\d:[0-5]\\d|Z))"
+        },
+    },
+    "Manifests-Required": [],
+    "Manifests-Allowed": ["sha512", "sha256"],
+    "Tag-Manifests-Required": [],
+    "Tag-Manifests-Allowed": ["sha512", "sha256"],
+    "Accept-BagIt-Version": ["1.0"]
+}
+# payload profile
+TEST_PAYLOAD_PROFILE_URL = "https://lzv.nrw/test_payload_profile.json"
+TEST_PAYLOAD_PROFILE = {
+    "BagIt-Payload-Profile-Info": {
+        "Version": "0.3.2"
+    }
+}
+
+
 # define fixture-directory
 @pytest.fixture(scope="session", name="fixtures")
 def _fixtures():
-    return Path("test_dcm_ip_builder/fixtures")
+    return Path(__file__).parent / "fixtures"
 
 
 @pytest.fixture(scope="session", name="file_storage")
 def _file_storage():
-    return Path("test_dcm_ip_builder/file_storage")
+    return Path(__file__).parent / "file_storage"
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -33,9 +83,12 @@ def disable_extension_logging():
     PrintStatusSettings.silent = True
 
 
-@pytest.fixture(name="testing_config")
+@pytest.fixture(scope="session", name="testing_config")
 def _testing_config(file_storage):
-    """Returns test-config"""
+    """
+    Returns test-config (shared across the session; tests that require
+    modified settings should subclass instead of mutating this class)
+    """
     # setup config-class
     class TestingConfig(AppConfig):
         FS_MOUNT_POINT = file_storage
@@ -45,56 +98,23 @@ def _testing_config(file_storage):
         ORCHESTRA_WORKER_ARGS = {"messages_interval": 0.01}
 
         MAPPING_PLUGINS = [DemoMappingPlugin]
-        BAGIT_PROFILE_URL = "https://lzv.nrw/test_bagit_profile.json"
-        BAGIT_PROFILE = {
-            "BagIt-Profile-Info": {
-                "Source-Organization": "Some source organization",
-                "External-Description": "Some description",
-                "BagIt-Profile-Identifier": "https://lzv.nrw/test_bagit_profile.json",
-                "Version": "0.3.2"
-            },
-            "Bag-Info": {
-                "DC-Title": {
-                    "required": True,
-                    "repeatable": False
-                },
-                "BagIt-Profile-Identifier": {
-                    "required": True,
-                    "repeatable": False,
-                    "description": "(https|http|sftp|file):\\/\\/\\S*"
-                },
-                "BagIt-Payload-Profile-Identifier": {
-                    "required": True,
-                    "repeatable": False,
-                    "description": "(https|http|sftp|file):\\/\\/\\S*"
-                },
-                "Bag-Software-Agent": {
-                    "required": False,
-                    "repeatable": False,
-                    "description": ".* v[\\w\\.\\-\\+]+"
-                },
-                "Bagging-DateTime": {
-                    "required": True,
-                    "repeatable": False,
-                    "description": "(\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d:[0-5]\\d\\.\\d+([+-][0-2]\\d:[0-5]\\d|Z))|(\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d:[0-5]\\d([+-][0-2]\\d:[0-5]\\d|Z))|(\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d([+-][0-2]\\d:[0-5]\\d|Z))"
-                },
-            },
-            "Manifests-Required": [],
-            "Manifests-Allowed": ["sha512", "sha256"],
-            "Tag-Manifests-Required": [],
-            "Tag-Manifests-Allowed": ["sha512", "sha256"],
-            "Accept-BagIt-Version": ["1.0"]
-        }
-        # payload profile
-        PAYLOAD_PROFILE_URL = "https://lzv.nrw/test_payload_profile.json"
-        PAYLOAD_PROFILE = {
-            "BagIt-Payload-Profile-Info": {
-                "Version": "0.3.2"
-            }
-        }
+        BAGIT_PROFILE_URL = TEST_BAGIT_PROFILE_URL
+        BAGIT_PROFILE = TEST_BAGIT_PROFILE
+        PAYLOAD_PROFILE_URL = TEST_PAYLOAD_PROFILE_URL
+        PAYLOAD_PROFILE = TEST_PAYLOAD_PROFILE
+
     return TestingConfig
 
 
-@pytest.fixture(name="test_bag_baginfo")
-def _test_bag_baginfo(fixtures):
-    return Bag(fixtures / "test-bag").baginfo
+@pytest.fixture(scope="session", name="readonly_test_bag")
+def _readonly_test_bag(fixtures):
+    """
+    Returns the test-bag from fixtures (must not be modified; make a
+    copy for tests that write to the bag).
+    """
+    return Bag(fixtures / "test-bag", load=False)
+
+
+@pytest.fixture(scope="session", name="test_bag_baginfo")
+def _test_bag_baginfo(readonly_test_bag):
+    return readonly_test_bag.baginfo
@@ -1,17 +1,25 @@
 """Test module for the custom `Bag`-class."""
 
-from shutil import copytree
+import os
+from shutil import copytree, rmtree
 from uuid import uuid4
 
-from dcm_ip_builder.components import Bag
+import pytest
 
+from dcm_ip_builder.components import Bag
 
-def test_bag_set_baginfo(fixtures, file_storage):
-    """Test method `Bag.set_baginfo`."""
 
-    # make copy of bag from fixtures
+@pytest.fixture(name="bag_dir")
+def _bag_dir(fixtures, file_storage):
+    """Returns path to a fresh copy of the test-bag from fixtures."""
     bag_dir = file_storage / str(uuid4())
     copytree(fixtures / "test-bag", bag_dir)
+    yield bag_dir
+    rmtree(bag_dir)
+
+
+def test_bag_set_baginfo(bag_dir):
+    """Test method `Bag.set_baginfo`."""
 
     bag = Bag(bag_dir, load=False)
 
@@ -23,22 +31,18 @@ def test_bag_set_baginfo(fixtures, file_storage):
     assert bag.baginfo == {"a": ["list", "of", "strings"], "b": ["no-list"]}
 
 
-def test_bag_custom_validate_format_hook_no_payload(fixtures, file_storage):
+def test_bag_custom_validate_format_hook_no_payload(bag_dir):
     """
     Test method `Bag.custom_validate_format_hook` regarding missing
     payload.
     """
 
-    # make copy of bag from fixtures
-    bag_dir = file_storage / str(uuid4())
-    copytree(fixtures / "test-bag", bag_dir)
-
     bag = Bag(bag_dir, load=False)
 
     # delete payload and refresh manifests
-    for f in (bag_dir / "data").glob("**/*"):
-        if f.is_file():
-            f.unlink()
+    for root, _, files in os.walk(bag_dir / "data"):
+        for f in files:
+            os.unlink(os.path.join(root, f))
 
     bag.set_manifests()
     bag.set_tag_manifests()
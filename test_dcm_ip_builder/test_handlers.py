@@ -10,7 +10,7 @@ from dcm_ip_builder import handlers
 from dcm_ip_builder.plugins.mapping import DemoMappingPlugin
 
 
-@pytest.fixture(name="validate_ip_handler")
+@pytest.fixture(scope="module", name="validate_ip_handler")
 def _validate_ip_handler(fixtures):
     return handlers.get_validate_ip_handler(fixtures)
 
@@ -60,7 +60,7 @@ def _validate_ip_handler(fixtures):
             ),
         ]
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=[f"stage {i}" for i, _ in enumerate(pytest_args, start=1)],
 )
 def test_validate_ip_handler(
     validate_ip_handler, json, status
@@ -74,7 +74,7 @@ def test_validate_ip_handler(
         print(output.last_message)
 
 
-@pytest.fixture(name="build_handler")
+@pytest.fixture(scope="module", name="build_handler")
 def _build_handler(fixtures):
     return handlers.get_build_handler(
         {DemoMappingPlugin.name: DemoMappingPlugin()},
@@ -134,7 +134,7 @@ def _build_handler(fixtures):
             Responses.GOOD.status
         ),
     ]),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))]
+    ids=[f"stage {i}" for i, _ in enumerate(pytest_args, start=1)]
 )
 def test_build_handler(
     build_handler, json, status
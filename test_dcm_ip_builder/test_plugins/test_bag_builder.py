@@ -1,12 +1,13 @@
 """Test module for the bag-builder plugins."""
 
+import os
 from shutil import copytree, rmtree
 from pathlib import Path
 from unittest import mock
 
 import pytest
 import bagit_utils
-from dcm_common import util, LoggingContext as Context
+from dcm_common import LoggingContext as Context
 from dcm_common.models.data_model import get_model_serialization_test
 
 from dcm_ip_builder.plugins import BagItBagBuilder, BagItPluginResult
@@ -33,6 +34,15 @@ def _tagmanifests():
     return ["sha256", "sha512"]
 
 
+@pytest.fixture(scope="session", name="bag_builder")
+def _bag_builder(working_dir, manifests, tagmanifests):
+    return BagItBagBuilder(
+        working_dir=working_dir,
+        manifests=manifests,
+        tagmanifests=tagmanifests
+    )
+
+
 @pytest.fixture(scope="session", name="bag_info")
 def _bag_info():
     return {
@@ -51,7 +61,15 @@ def run_around_tests(file_storage, working_dir):
         source_path: str | Path,
         dest_path: str | Path
     ):
-        copytree(src=source_path, dst=dest_path, dirs_exist_ok=False)
+        # files are only hardlinked: the builder never writes to its
+        # source files in place (bags are built in a temporary directory
+        # and moved afterwards) and tests only delete existing files
+        copytree(
+            src=source_path,
+            dst=dest_path,
+            dirs_exist_ok=False,
+            copy_function=os.link,
+        )
 
     # Run before each test starts
     # Delete folders
@@ -96,10 +114,8 @@ def test_BagItPluginResult(file_storage):
     ])
 )
 def test_get_validate_kwargs(
-    working_dir,
     bag_info,
-    manifests,
-    tagmanifests,
+    bag_builder,
     src,
     request,
     success
@@ -111,25 +127,18 @@ def test_get_validate_kwargs(
         src = request.getfixturevalue(src)
 
     # Create the bag
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    )
-    result = test_builder.get(
+    result = bag_builder.get(
         None,
         src=str(src),
-        bag_info=bag_info.copy(),
+        bag_info=bag_info,
     )
     assert result.success == success
 
 
 def test_get_minimal(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """
     Test the get method, with the minimal requirements.
@@ -138,15 +147,10 @@ def test_get_minimal(
     """
 
     # Create the bag
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    )
-    result = test_builder.get(
+    result = bag_builder.get(
         None,
         src=str(test_ie),
-        bag_info=bag_info.copy(),
+        bag_info=bag_info,
     )
 
     # Read the bagit.txt
@@ -158,7 +162,7 @@ def test_get_minimal(
     assert result.path is not None
     # Validate the bag version
     assert split_content_bagit[1].startswith(
-        test_builder.info["bagit_version"]
+        bag_builder.info["bagit_version"]
     )
 
     bag = Bag(result.path, load=False)
@@ -204,13 +208,13 @@ def test_get_diff_algorithms_for_manifests(
         result = test_builder.get(
             None,
             src=str(test_ie),
-            bag_info=bag_info.copy(),
+            bag_info=bag_info,
         )
     else:
         result = test_builder.get(
             None,
             src=str(test_ie),
-            bag_info=bag_info.copy(),
+            bag_info=bag_info,
             dest=str(dest)
         )
 
@@ -229,34 +233,29 @@ def test_get_diff_algorithms_for_manifests(
 
 
 def test_get_inplace(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """ Test making a bag with inplace True """
 
     # Create the bag
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    )
-    result = test_builder.get(
+    result = bag_builder.get(
         None,
         src=str(test_ie),
-        bag_info=bag_info.copy(),
+        bag_info=bag_info,
         exist_ok=True
     )
 
     assert result.success
     assert result.path is not None
+    with os.scandir(test_ie) as it:
+        entries = list(it)
     # The folders inside the bag have the expected names
-    folders = [x.name for x in test_ie.glob("*") if x.is_dir()]
+    folders = [e.name for e in entries if e.is_dir(follow_symlinks=False)]
     assert sorted(folders) == sorted(["data", "meta"])
     # The files inside the bag have the expected names
-    files = [x.name for x in test_ie.glob("*") if x.is_file()]
+    files = [e.name for e in entries if e.is_file(follow_symlinks=False)]
     files.remove("bagit.txt")
     files.remove("bag-info.txt")
     assert files == [x for x in files if x.startswith(
@@ -270,25 +269,19 @@ def test_get_inplace(
 
 
 def test_get_inplace_False(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """ Test making a bag with inplace False """
 
     # Create the bag
     bag_path = Path(test_ie.parent) / (test_ie.name + "_bag")
-    result = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    ).get(
+    result = bag_builder.get(
         None,
         src=str(test_ie),
         dest=str(bag_path),
-        bag_info=bag_info.copy()
+        bag_info=bag_info
     )
 
     assert result.success
@@ -296,11 +289,13 @@ def test_get_inplace_False(
     # Both folders exist, because the Bag was created with inplace False.
     assert test_ie.is_dir()
     assert bag_path.is_dir()
+    with os.scandir(bag_path) as it:
+        entries = list(it)
     # The folders inside the bag have the expected names
-    folders = [x.name for x in bag_path.glob("*") if x.is_dir()]
+    folders = [e.name for e in entries if e.is_dir(follow_symlinks=False)]
     assert sorted(folders) == sorted(["data", "meta"])
     # The files inside the bag have the expected names
-    files = [x.name for x in bag_path.glob("*") if x.is_file()]
+    files = [e.name for e in entries if e.is_file(follow_symlinks=False)]
     files.remove("bagit.txt")
     files.remove("bag-info.txt")
     assert files == [x for x in files if x.startswith(
@@ -312,8 +307,7 @@ def test_get_existing_output_path(
     working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """
     Test making a bag when the output_path already exists
@@ -326,15 +320,11 @@ def test_get_existing_output_path(
 
     # Attempt to make a bag and catch exception
     with pytest.raises(FileExistsError) as exc_info:
-        BagItBagBuilder(
-            working_dir=working_dir,
-            manifests=manifests,
-            tagmanifests=tagmanifests
-        ).get(
+        bag_builder.get(
             None,
             src=str(test_ie),
             dest=str(output_path),
-            bag_info=bag_info.copy()
+            bag_info=bag_info
         )
 
     assert exc_info.type is FileExistsError
@@ -342,11 +332,9 @@ def test_get_existing_output_path(
 
 
 def test_get_no_data_folder(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """
     Test making a bag from a directory without a 'data' folder
@@ -355,18 +343,11 @@ def test_get_no_data_folder(
     # Delete the data folder
     rmtree(test_ie / "data")
 
-    # Initiate the BagBuilder
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    )
-
     # Attempt to make a bag
-    result = test_builder.get(
+    result = bag_builder.get(
         None,
         src=str(test_ie),
-        bag_info=bag_info.copy()
+        bag_info=bag_info
     )
 
     assert not result.success
@@ -375,11 +356,9 @@ def test_get_no_data_folder(
 
 
 def test_get_no_meta_folder(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """
     Test making a bag from a directory without a 'meta' folder
@@ -388,18 +367,11 @@ def test_get_no_meta_folder(
     # Delete the meta folder
     rmtree(test_ie / "meta")
 
-    # Initiate the BagBuilder
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    )
-
     # Create the bag
-    result = test_builder.get(
+    result = bag_builder.get(
         None,
         src=str(test_ie),
-        bag_info=bag_info.copy()
+        bag_info=bag_info
     )
 
     assert result.success
@@ -408,29 +380,20 @@ def test_get_no_meta_folder(
 
 
 def test_get_additional_baginfo_from_builder(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """
     Test the make_bag method
     to ensure it adds just two specific fields in bag-info.txt.
     """
 
-    # Initiate the builder
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    )
-
     # Create the bag
-    result = test_builder.get(
+    result = bag_builder.get(
         None,
         src=str(test_ie),
-        bag_info=bag_info.copy()
+        bag_info=bag_info
     )
 
     # Load the bag-info.txt
@@ -451,11 +414,9 @@ def test_get_additional_baginfo_from_builder(
 
 
 def test_get_additional_root_folder(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """
     Test making a bag from a directory with an additional root folder
@@ -464,18 +425,11 @@ def test_get_additional_root_folder(
     # Add a root folder
     (test_ie / "some_data").mkdir(parents=True, exist_ok=True)
 
-    # Initiate the BagBuilder
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    )
-
     # Attempt to make a bag
-    result = test_builder.get(
+    result = bag_builder.get(
         None,
         src=str(test_ie),
-        bag_info=bag_info.copy()
+        bag_info=bag_info
     )
 
     assert not result.success
@@ -484,36 +438,24 @@ def test_get_additional_root_folder(
 
 
 def test_get_no_payload(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """
     Test making a bag from an IE without payload.
     """
 
     # Remove payload
-    for payload_file in util.list_directory_content(
-        test_ie / "data",
-        pattern="**/*",
-        condition_function=lambda p: p.is_file()
-    ):
-        payload_file.unlink()
-
-    # Initiate the BagBuilder
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    )
+    for root, _, files in os.walk(test_ie / "data"):
+        for payload_file in files:
+            os.unlink(os.path.join(root, payload_file))
 
     # Make a bag
-    result = test_builder.get(
+    result = bag_builder.get(
         None,
         src=str(test_ie),
-        bag_info=bag_info.copy()
+        bag_info=bag_info
     )
 
     assert result.success
@@ -522,24 +464,15 @@ def test_get_no_payload(
 
 
 def test_get_bagit_utils_build_error(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder
 ):
     """
     Test making a bag when the 'bagit_utils.Bag.build_from' method
     raises an error.
     """
 
-    # Initiate the BagBuilder
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
-    )
-
     # Make a bag and fake return of 'bagit_utils.Bag.build_from'
     bagit_utils_exception = bagit_utils.BagItError(
         "Some bagit_utils.BagItError."
@@ -548,8 +481,8 @@ def test_get_bagit_utils_build_error(
         "dcm_ip_builder.plugins.bag_builder.Bag.build_from",
         side_effect=bagit_utils_exception,
     ):
-        result = test_builder.get(
-            None, src=str(test_ie), bag_info=bag_info.copy()
+        result = bag_builder.get(
+            None, src=str(test_ie), bag_info=bag_info
         )
 
     assert result.success is False
@@ -558,35 +491,28 @@ def test_get_bagit_utils_build_error(
 
 
 def test_get_bagit_utils_validate_error(
-    working_dir,
     test_ie,
     bag_info,
-    manifests,
-    tagmanifests
+    bag_builder,
+    monkeypatch
 ):
     """
     Test validating a bag when the 'bagit_utils.Bag.validate_format'
     method returns error in report.
     """
 
-    # Initiate the BagBuilder
-    test_builder = BagItBagBuilder(
-        working_dir=working_dir,
-        manifests=manifests,
-        tagmanifests=tagmanifests
+    # fake return of validate_format
+    report = bagit_utils.common.ValidationReport(
+        False,
+        [bagit_utils.common.Issue("error", "BagIt-validation error.")],
     )
-
-    # repeat with validate_format
-    with mock.patch(
+    monkeypatch.setattr(
         "dcm_ip_builder.plugins.bag_builder.Bag.validate_format",
-        return_value=bagit_utils.common.ValidationReport(
-            False,
-            [bagit_utils.common.Issue("error", "BagIt-validation error.")],
-        ),
-    ):
-        result = test_builder.get(
-            None, src=str(test_ie), bag_info=bag_info.copy()
-        )
+        lambda *args, **kwargs: report,
+    )
+    result = bag_builder.get(
+        None, src=str(test_ie), bag_info=bag_info
+    )
 
     assert result.success is False
     assert result.path is None
@@ -2,6 +2,7 @@
 
 from base64 import b64encode
 
+import pytest
 import dill
 from dcm_common import LoggingContext as Context
 
@@ -13,18 +14,22 @@ from dcm_ip_builder.plugins.mapping import (
 )
 
 
-def test_generic_b64_minimal():
-    """Test generic-base64-mapping"""
-
+@pytest.fixture(scope="module", name="mapper_b64")
+def _mapper_b64():
     class Mapper(GenericMapper):
         def get_metadata(self, path, /, **kwargs):
             return kwargs
 
+    return b64encode(dill.dumps(Mapper))
+
+
+def test_generic_b64_minimal(mapper_b64):
+    """Test generic-base64-mapping"""
     result = GenericB64Plugin().get(
         None,
         path="<source-file>",
         mapper={
-            "base64": b64encode(dill.dumps(Mapper)),
+            "base64": mapper_b64,
             "args": {"field-1": "value-1"},
         },
     )
@@ -38,7 +43,21 @@ def test_generic_url_minimal(fixtures):
         None,
         path="<source-file>",
         mapper={
-            "url": f"file://{(fixtures / 'plugins' / 'm.py').resolve()}",
+            "url": f"file://{fixtures / 'plugins' / 'm.py'}",
+            "args": {"field-1": "value-1"},
+        },
+    )
+
+    assert result.metadata == {"field-1": "value-1"}
+
+
+def test_generic_url_localhost(fixtures):
+    """Test generic-url-mapping for file-url with host 'localhost'"""
+    result = GenericUrlPlugin().get(
+        None,
+        path="<source-file>",
+        mapper={
+            "url": f"file://localhost{fixtures / 'plugins' / 'm.py'}",
             "args": {"field-1": "value-1"},
         },
     )
@@ -68,7 +87,7 @@ def test_generic_url_docs(fixtures):
         None,
         path=str(fixtures / "ie-demo-import" / "source_metadata.xml"),
         mapper={
-            "url": f"file://{(fixtures / 'plugins' / 'm2.py').resolve()}",
+            "url": f"file://{fixtures / 'plugins' / 'm2.py'}",
             "args": {},
         },
     )
@@ -89,7 +108,7 @@ def test_generic_url_docs_bad(fixtures):
             fixtures / "ie-demo-import" / "source_metadata_missing_title.xml"
         ),
         mapper={
-            "url": f"file://{(fixtures / 'plugins' / 'm2.py').resolve()}",
+            "url": f"file://{fixtures / 'plugins' / 'm2.py'}",
             "args": {},
         },
     )
@@ -97,3 +116,18 @@ def test_generic_url_docs_bad(fixtures):
     assert not result.success
     assert result.metadata is None
     assert Context.ERROR in result.log
+
+
+def test_generic_url_missing_file(fixtures):
+    """Test generic-url-mapping for non-existent local file"""
+    result = GenericUrlPlugin().get(
+        None,
+        path="<source-file>",
+        mapper={
+            "url": f"file://{fixtures / 'plugins' / 'missing.py'}",
+            "args": {},
+        },
+    )
+
+    assert not result.success
+    assert "cannot access url" in str(result.log[Context.ERROR])
@@ -37,6 +37,11 @@ def _simple_xml_file(file_storage: Path, ns):
     return path
 
 
+@pytest.fixture(name="simple_xml_tree", scope="module")
+def _simple_xml_tree(simple_xml_file: Path):
+    return util.load_xml_tree_from_file(simple_xml_file)
+
+
 def test_load_xml_tree_from_file(simple_xml_file: Path):
     """
     Test basic functionality of function 'load_xml_tree_from_file'.
@@ -50,65 +55,97 @@ def test_load_xml_tree_from_file(simple_xml_file: Path):
     )
 
 
-def test_xmlmappingrule_map_minimal(simple_xml_file: Path, ns):
+def test_xmlmappingrule_map_minimal(simple_xml_tree, ns):
     """Test minimal 'XMLMappingRule.map' for simple xml-data."""
-    tree = util.load_xml_tree_from_file(simple_xml_file)
-    assert util.XMLMappingRule(["a", "value"], "A", ns=ns).map(tree) == [
-        "1",
-        "2",
-    ]
+    assert util.XMLMappingRule(["a", "value"], "A", ns=ns).map(
+        simple_xml_tree
+    ) == ["1", "2"]
     assert util.XMLMappingRule(["alternative:a", "value"], "A", ns=ns).map(
-        tree
+        simple_xml_tree
     ) == ["3"]
-    assert util.XMLMappingRule(["b", "value"], "A", ns=ns).map(tree) == []
+    assert util.XMLMappingRule(["b", "value"], "A", ns=ns).map(
+        simple_xml_tree
+    ) == []
 
 
-def test_xmlmappingrule_map_reduce(simple_xml_file: Path, ns):
+def test_xmlmappingrule_map_reduce(simple_xml_tree, ns):
     """Test 'XMLMappingRule.map' for simple xml-data with reducer."""
-    tree = util.load_xml_tree_from_file(simple_xml_file)
     assert util.XMLMappingRule(
         ["a", "value"], "A", ns=ns, reduce=lambda x: x.attrib["p"]
-    ).map(tree) == ["a", "a"]
+    ).map(simple_xml_tree) == ["a", "a"]
 
 
-def test_xmlmappingrule_map_post_process(simple_xml_file: Path, ns):
+def test_xmlmappingrule_map_post_process(simple_xml_tree, ns):
     """
     Test 'XMLMappingRule.map' for simple xml-data with post_process.
     """
-    tree = util.load_xml_tree_from_file(simple_xml_file)
     assert util.XMLMappingRule(
         ["a", "value"], "A", ns=ns, post_process=lambda x: list(map(int, x))
-    ).map(tree) == [1, 2]
+    ).map(simple_xml_tree) == [1, 2]
 
 
-def test_xmlxpathmappingrule_map_minimal(simple_xml_file: Path, ns):
+def test_xmlmappingrule_map_restored(simple_xml_tree, ns):
+    """
+    Test 'XMLMappingRule.map' for an instance that has been restored
+    without calling '__init__' (like when unpickling a mapper that has
+    been serialized with a previous version).
+    """
+    rule = util.XMLMappingRule.__new__(util.XMLMappingRule)
+    rule.__dict__.update(
+        util.XMLMappingRule(["a", "value"], "A", ns=ns).__dict__
+    )
+    assert rule.map(simple_xml_tree) == ["1", "2"]
+
+
+def test_xmlxpathmappingrule_map_minimal(simple_xml_tree, ns):
     """Test minimal 'XMLXPathMappingRule.map' for simple xml-data."""
-    tree = util.load_xml_tree_from_file(simple_xml_file)
-    assert util.XMLXPathMappingRule("./a/value", "A", ns=ns).map(tree) == [
-        "1",
-        "2",
-    ]
+    assert util.XMLXPathMappingRule("./a/value", "A", ns=ns).map(
+        simple_xml_tree
+    ) == ["1", "2"]
     assert util.XMLXPathMappingRule("./alternative:a/value", "A", ns=ns).map(
-        tree
+        simple_xml_tree
     ) == ["3"]
-    assert util.XMLXPathMappingRule("./b/value", "A", ns=ns).map(tree) == []
+    assert util.XMLXPathMappingRule("./b/value", "A", ns=ns).map(
+        simple_xml_tree
+    ) == []
 
 
-def test_xmlxpathmappingrule_map_reduce(simple_xml_file: Path, ns):
+def test_xmlxpathmappingrule_map_reduce(simple_xml_tree, ns):
     """
     Test 'XMLXPathMappingRule.map' for simple xml-data with reducer.
     """
-    tree = util.load_xml_tree_from_file(simple_xml_file)
     assert util.XMLXPathMappingRule(
         "./a/value", "A", ns=ns, reduce=lambda x: x.attrib["p"]
-    ).map(tree) == ["a", "a"]
+    ).map(simple_xml_tree) == ["a", "a"]
 
 
-def test_xmlxpathmappingrule_map_post_process(simple_xml_file: Path, ns):
+def test_xmlxpathmappingrule_map_post_process(simple_xml_tree, ns):
     """
     Test 'XMLXPathMappingRule.map' for simple xml-data with post_process.
     """
-    tree = util.load_xml_tree_from_file(simple_xml_file)
     assert util.XMLXPathMappingRule(
         "./a/value", "A", ns=ns, post_process=lambda x: list(map(int, x))
-    ).map(tree) == [1, 2]
+    ).map(simple_xml_tree) == [1, 2]
+
+
+def test_xmlxpathmappingrule_map_unknown_prefix(simple_xml_tree):
+    """
+    Test 'XMLXPathMappingRule.map' with unknown namespace-prefix (error
+    is raised on evaluation, not on instantiation).
+    """
+    rule = util.XMLXPathMappingRule("./unknown:a/value", "A")
+    with pytest.raises(SyntaxError):
+        rule.map(simple_xml_tree)
+
+
+def test_xmlxpathmappingrule_map_restored(simple_xml_tree, ns):
+    """
+    Test 'XMLXPathMappingRule.map' for an instance that has been
+    restored without calling '__init__' (like when unpickling a mapper
+    that has been serialized with a previous version).
+    """
+    rule = util.XMLXPathMappingRule.__new__(util.XMLXPathMappingRule)
+    rule.__dict__.update(
+        util.XMLXPathMappingRule("./a/value", "A", ns=ns).__dict__
+    )
+    assert rule.map(simple_xml_tree) == ["1", "2"]
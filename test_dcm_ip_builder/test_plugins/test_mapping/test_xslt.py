@@ -6,7 +6,12 @@ from dcm_common.logger import LoggingContext as Context
 from dcm_ip_builder.plugins.mapping import XSLTMappingPlugin
 
 
-@pytest.fixture(name="xslt")
+@pytest.fixture(scope="session", name="xslt_plugin")
+def _xslt_plugin():
+    return XSLTMappingPlugin()
+
+
+@pytest.fixture(scope="session", name="xslt")
 def _xslt():
     return """<xsl:stylesheet version="1.0"
                 xmlns:xs="http://www.w3.org/2001/XMLSchema"
@@ -95,9 +100,9 @@ def _expected_bag_info():
     }
 
 
-def test_xsltplugin_minimal(fixtures, expected_bag_info, xslt):
+def test_xsltplugin_minimal(xslt_plugin, fixtures, expected_bag_info, xslt):
     """Test xslt-plugin mapping for typical setup."""
-    result = XSLTMappingPlugin().get(
+    result = xslt_plugin.get(
         None,
         path=fixtures / "ie-demo-import" / "source_metadata.xml",
         xslt=xslt,
@@ -107,13 +112,69 @@ def test_xsltplugin_minimal(fixtures, expected_bag_info, xslt):
     assert result.metadata == expected_bag_info
 
 
-def test_xslt_plugin_missing_title(fixtures, expected_bag_info, xslt):
+def test_xsltplugin_repeated(xslt_plugin, fixtures, expected_bag_info, xslt):
+    """
+    Test xslt-plugin mapping for repeated use of the same (cached)
+    xslt.
+    """
+    for _ in range(2):
+        result = xslt_plugin.get(
+            None,
+            path=fixtures / "ie-demo-import" / "source_metadata.xml",
+            xslt=xslt,
+        )
+        assert result.success
+        assert result.metadata == expected_bag_info
+
+
+def test_xsltplugin_xml_declaration(
+    xslt_plugin, fixtures, expected_bag_info, xslt
+):
+    """
+    Test xslt-plugin mapping for xslt with XML-declaration that
+    specifies an encoding.
+    """
+    result = xslt_plugin.get(
+        None,
+        path=fixtures / "ie-demo-import" / "source_metadata.xml",
+        xslt='<?xml version="1.0" encoding="UTF-8"?>\n' + xslt,
+    )
+
+    assert result.success
+    assert result.metadata == expected_bag_info
+
+
+def test_xsltplugin_xml_declaration_other_encoding(
+    xslt_plugin, fixtures, expected_bag_info, xslt
+):
+    """
+    Test xslt-plugin mapping for xslt with XML-declaration that
+    specifies an encoding other than UTF-8 and non-ASCII text (text is
+    not decoded according to the declaration).
+    """
+    result = xslt_plugin.get(
+        None,
+        path=fixtures / "ie-demo-import" / "source_metadata.xml",
+        xslt=(
+            '<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+            + xslt.replace("https://d-nb.info/gnd/0", "Bücherei Köln")
+        ),
+    )
+
+    assert result.success
+    assert result.metadata == expected_bag_info | {
+        "Source-Organization": ["Bücherei Köln"]
+    }
+
+
+def test_xslt_plugin_missing_title(
+    xslt_plugin, fixtures, expected_bag_info, xslt
+):
     """
     Test xslt-plugin mapping for metadata that is missing a dc-title.
     """
     bag_info = (
-        XSLTMappingPlugin()
-        .get(
+        xslt_plugin.get(
             None,
             path=fixtures
             / "ie-demo-import"
@@ -301,10 +362,12 @@ def test_xslt_plugin_missing_title(fixtures, expected_bag_info, xslt):
         "no xsl string",
     ]
 )
-def test_xsltplugin_errors(fixtures, xslt_string, expected_errors):
+def test_xsltplugin_errors(
+    xslt_plugin, fixtures, xslt_string, expected_errors
+):
     """Test xslt-plugin mapping for typical errors in the xsl file."""
 
-    result = XSLTMappingPlugin().get(
+    result = xslt_plugin.get(
         None,
         path=fixtures / "ie-demo-import" / "source_metadata.xml",
         xslt=xslt_string,
@@ -1,6 +1,8 @@
 """Test module for the bagit_profile plugin."""
 
 from unittest import mock
+from copy import deepcopy
+import pickle
 
 import pytest
 import bagit_utils
@@ -15,12 +17,12 @@ def _bag_path(file_storage):
     return file_storage / "test-bag"
 
 
-@pytest.fixture(name="profile_identifier")
+@pytest.fixture(scope="session", name="profile_identifier")
 def _profile_identifier(testing_config):
     return testing_config.BAGIT_PROFILE_URL
 
 
-@pytest.fixture(name="bagit_profile_info")
+@pytest.fixture(scope="session", name="bagit_profile_info")
 def _baginfo_profile_info(profile_identifier):
     return {
         "Source-Organization": "",
@@ -30,7 +32,7 @@ def _baginfo_profile_info(profile_identifier):
     }
 
 
-@pytest.fixture(name="bagit_profile_dict")
+@pytest.fixture(scope="session", name="bagit_profile_dict")
 def _baginfo_profile_dict(bagit_profile_info):
     return {
         "BagIt-Profile-Info": bagit_profile_info,
@@ -83,10 +85,10 @@ def test_get(
     # mock profile-url server + validator to return specific result
     with mock.patch(
         "bagit_utils.validator.load_json_url",
-        side_effect=lambda *args, **kwargs: bagit_profile_dict,
+        return_value=bagit_profile_dict,
     ), mock.patch(
         "bagit_utils.BagValidator.validate_once",
-        side_effect=lambda *args, **kwargs: bagit_utils.common.ValidationReport(
+        return_value=bagit_utils.common.ValidationReport(
             expected_valid,
             (
                 [bagit_utils.common.Issue("info", "no issues")]
@@ -115,6 +117,7 @@ def test_validate_bag_info(profile_identifier, bagit_profile_dict, bag_path):
     'regex').
     """
 
+    bagit_profile_dict = deepcopy(bagit_profile_dict)
     bagit_profile_dict["Bag-Info"] = {
         "Property": {
             "description": r"[0-9]*"
@@ -136,7 +139,7 @@ def test_validate_bag_info(profile_identifier, bagit_profile_dict, bag_path):
     # fake profile-url server + Bag-definition
     with mock.patch(
         "bagit_utils.validator.load_json_url",
-        side_effect=lambda *args, **kwargs: bagit_profile_dict,
+        return_value=bagit_profile_dict,
     ), mock.patch(
         "dcm_ip_builder.plugins.validation.bagit_profile.Bag",
         side_effect=FakeBag,
@@ -160,6 +163,7 @@ def test_get_bad_bag(
     and sha512.
     """
 
+    bagit_profile_dict = deepcopy(bagit_profile_dict)
     bagit_profile_dict["Manifests-Required"] = ["md5"]
 
     # setup validator
@@ -171,7 +175,7 @@ def test_get_bad_bag(
     # fake profile-url server
     with mock.patch(
         "bagit_utils.validator.load_json_url",
-        side_effect=lambda *args, **kwargs: bagit_profile_dict,
+        return_value=bagit_profile_dict,
     ):
         # run plugin
         result = validator.get(
@@ -250,3 +254,72 @@ def test_get_profile_error(
     assert Context.ERROR in result.log
     assert len(result.log[Context.ERROR]) == 1
     assert "Unable to load profile" in result.log[Context.ERROR][0].body
+
+
+def test_get_profile_cached(
+    profile_identifier,
+    bagit_profile_dict,
+    bag_path,
+):
+    """
+    Test method `get` of `BagItProfilePlugin` for repeated use of the
+    same profile-url.
+    """
+
+    # setup validator
+    validator = BagItProfilePlugin(
+        default_profile_url=profile_identifier,
+        default_profile=bagit_profile_dict
+    )
+
+    # fake profile-url server
+    with mock.patch(
+        "bagit_utils.validator.load_json_url",
+        return_value=bagit_profile_dict,
+    ) as load_json_url:
+        # run plugin
+        for _ in range(2):
+            result = validator.get(
+                None,
+                path=str(bag_path),
+                profile_url="https://lzv.nrw/another_bagit_profile.json",
+            )
+            assert result.success
+
+    load_json_url.assert_called_once()
+
+
+def test_get_profile_cached_pickle(
+    profile_identifier,
+    bagit_profile_dict,
+    bag_path,
+):
+    """
+    Test that `BagItProfilePlugin` with profile-cache can be pickled.
+    """
+
+    # setup validator
+    validator = BagItProfilePlugin(
+        default_profile_url=profile_identifier,
+        default_profile=bagit_profile_dict
+    )
+
+    # fake profile-url server
+    with mock.patch(
+        "bagit_utils.validator.load_json_url",
+        return_value=bagit_profile_dict,
+    ) as load_json_url:
+        validator.get(
+            None,
+            path=str(bag_path),
+            profile_url="https://lzv.nrw/another_bagit_profile.json",
+        )
+        restored = pickle.loads(pickle.dumps(validator))
+        result = restored.get(
+            None,
+            path=str(bag_path),
+            profile_url="https://lzv.nrw/another_bagit_profile.json",
+        )
+
+    assert result.success
+    load_json_url.assert_called_once()
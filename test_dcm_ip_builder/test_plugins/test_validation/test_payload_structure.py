@@ -1,53 +1,124 @@
 """Test module for the `PayloadStructurePlugin`."""
 
+from typing import Iterable
+import os
+from pathlib import Path
 from shutil import rmtree, copytree
 from uuid import uuid4
-from copy import deepcopy
 import re
 from unittest import mock
 
 import pytest
-from dcm_common.util import write_test_file, list_directory_content
 from dcm_common.logger import LoggingContext as Context
 
 from dcm_ip_builder.plugins import PayloadStructurePlugin
 
 
-def pattern_in_list_of_strings(
-    pattern: str, list_of_strings: list[str]
+REQUIRED_NOT_ALLOWED = re.compile(
+    r"Required payload directory '[^']+' not listed in "
+    + r"Payload-Folders-Allowed"
+)
+REQUIRED_NOT_PRESENT = re.compile(
+    r"Required payload directory '[^']+' is not present"
+)
+ILLEGAL_LOCATION = re.compile(
+    r"File '[^']+' found in illegal location of payload directory"
+)
+CAPITALIZATION = re.compile(
+    r"File '[^']+' and '[^']+' only differ in their capitalization"
+)
+
+
+def pattern_in_log_records(
+    pattern: str | re.Pattern, records: Iterable
 ) -> tuple[bool, int]:
     """
-    Iterate over a list of strings and count occurrences of pattern.
+    Iterate over log records and count occurrences of pattern in their
+    bodies.
     """
 
-    occurrences = 0
-
-    for _msg in list_of_strings:
-        if re.match(pattern, _msg) is not None:
-            occurrences = occurrences + 1
+    search = re.compile(pattern).search
+    occurrences = sum(1 for record in records if search(record.body))
     return occurrences > 0, occurrences
 
 
-@pytest.fixture(scope="session", name="bag_path")
-def _bag_path(file_storage):
-    return file_storage / "test-bag-structure"
+def create_files(files: Iterable[Path]) -> None:
+    """
+    Create (empty) `files` after creating all required parent
+    directories.
+    """
+    files = list(files)
+    for directory in {file.parent for file in files}:
+        directory.mkdir(parents=True, exist_ok=True)
+    for file in files:
+        file.touch()
+
+
+@pytest.fixture(scope="module", name="bag_template")
+def _bag_template(file_storage, minimal_profile):
+    """
+    Generates the basic test-bag directory structure once per module.
+    """
+    template = file_storage / "test-bag-structure-template"
+    if template.is_dir():
+        rmtree(template)
+
+    # (empty) dummy-files are sufficient for payload-structure validation
+    bag_data = template / "data"
+    for required in minimal_profile["Payload-Folders-Required"]:
+        (bag_data / required).mkdir(parents=True, exist_ok=True)
+        (bag_data / required / "dummy.txt").touch()
+
+    for allowed in minimal_profile["Payload-Folders-Allowed"]:
+        if isinstance(allowed, dict):
+            (bag_data / allowed["example"]).mkdir(parents=True, exist_ok=True)
+            (bag_data / allowed["example"] / "dummy.doc").touch()
+        else:
+            (bag_data / allowed).mkdir(parents=True, exist_ok=True)
+
+    yield template
+
+    rmtree(template)
+
+
+@pytest.fixture(name="bag_path")
+def _bag_path(file_storage, bag_template):
+    """Provides a fresh copy of the test-bag for every test."""
+    bag_path = file_storage / "test-bag-structure"
+    if bag_path.is_dir():
+        rmtree(bag_path)
+    copytree(bag_template, bag_path)
+
+    yield bag_path
+
+    if bag_path.is_dir():
+        rmtree(bag_path)
 
 
 @pytest.fixture(name="duplicate_bag")
 def _duplicate_bag(bag_path, testing_config):
     """Duplicates "bag_path" to another directory."""
     duplicate = testing_config.FS_MOUNT_POINT / str(uuid4())
-    copytree(bag_path, duplicate)
-    return duplicate
+    try:
+        # files are only hardlinked: tests add or delete files but never
+        # write to existing ones
+        copytree(bag_path, duplicate, copy_function=os.link)
+    except OSError:
+        rmtree(duplicate, ignore_errors=True)
+        copytree(bag_path, duplicate)
+
+    yield duplicate
+
+    rmtree(duplicate)
 
 
-@pytest.fixture(name="minimal_profile_url")
+@pytest.fixture(scope="module", name="minimal_profile_url")
 def _minimal_profile_url():
     """Provide a minimal payload profile url."""
     return "MINIMAL_PROFILE_URL"
 
 
-@pytest.fixture(name="minimal_profile")
+@pytest.fixture(scope="module", name="minimal_profile")
 def _minimal_profile():
     """Provide a minimal payload profile."""
     return {
@@ -62,7 +133,7 @@ def _minimal_profile():
     }
 
 
-@pytest.fixture(name="payload_structure_validator")
+@pytest.fixture(scope="module", name="payload_structure_validator")
 def _payload_structure_validator(minimal_profile_url, minimal_profile):
     """Provide a minimal payload structure validator."""
     return PayloadStructurePlugin(
@@ -71,36 +142,6 @@ def _payload_structure_validator(minimal_profile_url, minimal_profile):
     )
 
 
-@pytest.fixture(autouse=True)
-def run_around_tests(minimal_profile, bag_path):
-
-    # Run before each test starts
-    # Generate the example bag in fixtures to (cleaned) working dir.
-    if bag_path.is_dir():
-        rmtree(bag_path)
-
-    # generate basic test-bag directory structure
-    bag_data = bag_path / "data"
-    for required in minimal_profile["Payload-Folders-Required"]:
-        (bag_data / required).mkdir(parents=True, exist_ok=True)
-        write_test_file(bag_data / required / "dummy.txt")
-
-    for allowed in minimal_profile["Payload-Folders-Allowed"]:
-        if isinstance(allowed, dict):
-            (bag_data / allowed["example"]).mkdir(parents=True, exist_ok=True)
-            write_test_file(bag_data / allowed["example"] / "dummy.doc")
-        else:
-            (bag_data / allowed).mkdir(parents=True, exist_ok=True)
-
-    # Run a test
-    yield
-
-    # Run after each test ends
-    # Delete folders
-    if bag_path.is_dir():
-        rmtree(bag_path)
-
-
 def test_valid_bag(payload_structure_validator, bag_path):
     """Test valid bag."""
 
@@ -116,8 +157,12 @@ def test_invalid_bag_required_but_not_allowed_directory(
     """Test bag in which a required directory is not allowed."""
 
     # modify minimal profile
-    modified_profile = deepcopy(minimal_profile)
-    modified_profile["Payload-Folders-Required"].append("not_allowed")
+    modified_profile = {
+        **minimal_profile,
+        "Payload-Folders-Required": [
+            *minimal_profile["Payload-Folders-Required"], "not_allowed"
+        ],
+    }
     # make additional required directory
     (bag_path / "data" / "not_allowed").mkdir()
 
@@ -131,9 +176,9 @@ def test_invalid_bag_required_but_not_allowed_directory(
 
     assert result.success
     assert not result.valid
-    pattern_occurs, _ = pattern_in_list_of_strings(
-        r".*Required payload directory '.*' not listed in Payload-Folders-Allowed.*",
-        str(result.log.pick(Context.ERROR)).split("\n"),
+    pattern_occurs, _ = pattern_in_log_records(
+        REQUIRED_NOT_ALLOWED,
+        result.log[Context.ERROR],
     )
     assert pattern_occurs
 
@@ -153,14 +198,14 @@ def test_invalid_bag_missing_required_directory(
 
     assert result.success
     assert not result.valid
-    pattern_occurs, _ = pattern_in_list_of_strings(
-        r".*Required payload directory '.*' is not present.*",
-        str(result.log.pick(Context.ERROR)).split("\n"),
+    pattern_occurs, _ = pattern_in_log_records(
+        REQUIRED_NOT_PRESENT,
+        result.log[Context.ERROR],
     )
     assert pattern_occurs
-    pattern_occurs, _ = pattern_in_list_of_strings(
-        r".*File '.*' found in illegal location of payload directory.*",
-        str(result.log.pick(Context.ERROR)).split("\n"),
+    pattern_occurs, _ = pattern_in_log_records(
+        ILLEGAL_LOCATION,
+        result.log[Context.ERROR],
     )
     assert pattern_occurs
 
@@ -172,21 +217,20 @@ def test_invalid_bag_files_in_every_directory(
     (assuming not all directories are allowed)."""
 
     # iterate through directory
-    dir_list = list_directory_content(
-        bag_path,
-        pattern="**/*",
-        condition_function=lambda p: p.is_dir(),
-    )
-    for some_dir in dir_list:
-        write_test_file(some_dir / "test.dat")
+    dir_list = [
+        Path(root) / name
+        for root, dirs, _ in os.walk(bag_path)
+        for name in dirs
+    ]
+    create_files(some_dir / "test.dat" for some_dir in dir_list)
 
     result = payload_structure_validator.get(None, path=str(bag_path))
 
     assert result.success
     assert not result.valid
-    _, match_count = pattern_in_list_of_strings(
-        r".*File '.*' found in illegal location of payload directory.*",
-        str(result.log.pick(Context.ERROR)).split("\n"),
+    _, match_count = pattern_in_log_records(
+        ILLEGAL_LOCATION,
+        result.log[Context.ERROR],
     )
 
     assert match_count == 2
@@ -199,26 +243,21 @@ def test_invalid_bag_files_in_certain_directory(
     Payload-Folders-Allowed reads 'allowed_dir/[0-9]' exclude files
     named 'allowed_dir/4a.dat' and similar)."""
 
-    write_test_file(
-        bag_path / "data" / "optional_directory" / "4" / "test.dat",
-        mkdir=True,
-    )
-    write_test_file(
-        bag_path / "data" / "optional_directory" / "4atest.dat",
-        mkdir=True,
-    )
-    write_test_file(
-        bag_path / "data" / "optional_directory" / "4a" / "test.dat",
-        mkdir=True,
+    create_files(
+        [
+            bag_path / "data" / "optional_directory" / "4" / "test.dat",
+            bag_path / "data" / "optional_directory" / "4atest.dat",
+            bag_path / "data" / "optional_directory" / "4a" / "test.dat",
+        ]
     )
 
     result = payload_structure_validator.get(None, path=str(bag_path))
 
     assert result.success
     assert not result.valid
-    _, match_count = pattern_in_list_of_strings(
-        r".*File '.*' found in illegal location of payload directory.*",
-        str(result.log.pick(Context.ERROR)).split("\n"),
+    _, match_count = pattern_in_log_records(
+        ILLEGAL_LOCATION,
+        result.log[Context.ERROR],
     )
 
     assert match_count == 2
@@ -231,22 +270,20 @@ def test_invalid_bag_files_in_certain_directory_noregex(
     directories (e.g. if Payload-Folders-Allowed reads 'required_dir'
     exclude files named 'required_dir_a.dat' and similar)."""
 
-    write_test_file(
-        bag_path / "data" / "required_directory_test.dat",
-        mkdir=True,
-    )
-    write_test_file(
-        bag_path / "data" / "required_directory" / "test.dat",
-        mkdir=True,
+    create_files(
+        [
+            bag_path / "data" / "required_directory_test.dat",
+            bag_path / "data" / "required_directory" / "test.dat",
+        ]
     )
 
     result = payload_structure_validator.get(None, path=str(bag_path))
 
     assert result.success
     assert not result.valid
-    pattern_occurs, _ = pattern_in_list_of_strings(
-        r".*File '.*' found in illegal location of payload directory.*",
-        str(result.log.pick(Context.ERROR)).split("\n"),
+    pattern_occurs, _ = pattern_in_log_records(
+        ILLEGAL_LOCATION,
+        result.log[Context.ERROR],
     )
     assert pattern_occurs
 
@@ -258,22 +295,20 @@ def test_invalid_bag_filenames_differ_only_by_capitalization(
     capitalization."""
 
     # write two test files
-    write_test_file(
-        bag_path / "data" / "required_directory" / "test.dat",
-        mkdir=True,
-    )
-    write_test_file(
-        bag_path / "data" / "required_directory" / "TEST.dat",
-        mkdir=True,
+    create_files(
+        [
+            bag_path / "data" / "required_directory" / "test.dat",
+            bag_path / "data" / "required_directory" / "TEST.dat",
+        ]
     )
 
     result = payload_structure_validator.get(None, path=str(bag_path))
 
     assert result.success
     assert not result.valid
-    pattern_occurs, _ = pattern_in_list_of_strings(
-        r".*File '.*' and '.*' only differ in their capitalization.*",
-        str(result.log.pick(Context.ERROR)).split("\n"),
+    pattern_occurs, _ = pattern_in_log_records(
+        CAPITALIZATION,
+        result.log[Context.ERROR],
     )
     assert pattern_occurs
 
@@ -300,12 +335,20 @@ def test_get_request_profile(
     if request_profile:
 
         # fake get_profile to load another profile
-        user_profile = deepcopy(minimal_profile)
-        user_profile["Payload-Folders-Required"].append("another_required")
-        user_profile["Payload-Folders-Allowed"].append("another_required")
+        user_profile = {
+            **minimal_profile,
+            "Payload-Folders-Required": [
+                *minimal_profile["Payload-Folders-Required"],
+                "another_required",
+            ],
+            "Payload-Folders-Allowed": [
+                *minimal_profile["Payload-Folders-Allowed"],
+                "another_required",
+            ],
+        }
         with mock.patch(
             "dcm_ip_builder.plugins.validation.payload_structure.get_profile",
-            side_effect=lambda *args, **kwargs: user_profile,
+            return_value=user_profile,
         ):
             result = payload_structure_validator.get(
                 None,
@@ -342,12 +385,9 @@ def test_bag_no_payload(
     """
 
     # remove payload from bag
-    for payload_file in list_directory_content(
-        duplicate_bag / "data",
-        pattern="**/*",
-        condition_function=lambda p: p.is_file()
-    ):
-        payload_file.unlink()
+    for root, _, files in os.walk(duplicate_bag / "data"):
+        for payload_file in files:
+            os.unlink(os.path.join(root, payload_file))
 
     if keep_file:
         # add an empty .keep file in an allowed location
@@ -1,6 +1,8 @@
 """Test module for the significant_properties plugin."""
 
-from shutil import copytree, copyfile
+import os
+from pathlib import Path
+from shutil import copytree, copyfile, rmtree
 from uuid import uuid4
 
 import pytest
@@ -9,17 +11,69 @@ from dcm_common.logger import LoggingContext as Context
 from dcm_ip_builder.plugins import SignificantPropertiesPlugin
 
 
-@pytest.fixture(name="xsd_schema")
+@pytest.fixture(scope="session", name="xsd_schema")
 def _xsd_schema():
     return "https://www.loc.gov/standards/premis/premis.xsd"
 
 
+@pytest.fixture(scope="module", name="validators")
+def _validators(xsd_schema, testing_config):
+    """
+    Provides validators without (key `None`) and with (key `True`)
+    known significant properties; the schema is only loaded once per
+    validator and module.
+    """
+    return {
+        known_sig_prop: SignificantPropertiesPlugin(
+            xml_path=(
+                testing_config.META_DIRECTORY
+                / testing_config.SIGNIFICANT_PROPERTIES
+            ),
+            schema=xsd_schema,
+            known_sig_prop=(
+                testing_config.VALIDATION_SIGPROP_KNOWN_TYPES
+                if known_sig_prop is not None
+                else None
+            ),
+        )
+        for known_sig_prop in (None, True)
+    }
+
+
+@pytest.fixture(name="validator")
+def _validator(validators):
+    """Provides the validator with known significant properties."""
+    return validators[True]
+
+
+def _overlay(src: Path, dst: Path) -> None:
+    """
+    Recreates the directory structure of `src` in `dst` and symlinks
+    all files (tests have to unlink a file before replacing it).
+    """
+    for root, _, files in os.walk(src):
+        target = dst / Path(root).relative_to(src)
+        target.mkdir(parents=True, exist_ok=True)
+        for file in files:
+            # link to absolute targets (relative targets would be
+            # resolved relative to the link's directory)
+            os.symlink(os.path.abspath(Path(root) / file), target / file)
+
+
 @pytest.fixture(name="duplicate_bag")
 def _duplicate_bag(file_storage):
-    """Duplicates "test-bag" to another directory."""
+    """Duplicates "test-bag" to another directory (as symlink-overlay)."""
     duplicate = file_storage / str(uuid4())
-    copytree(file_storage / "test-bag", duplicate)
-    return duplicate
+    try:
+        _overlay(file_storage / "test-bag", duplicate)
+    except NotImplementedError:
+        # platform does not support symlinks
+        rmtree(duplicate, ignore_errors=True)
+        copytree(file_storage / "test-bag", duplicate)
+
+    yield duplicate
+
+    rmtree(duplicate)
 
 
 @pytest.fixture(scope="session", name="sig_prop_valid")
@@ -46,34 +100,22 @@ def _sig_prop_corrupt(file_storage):
     ids=["without known_sig_prop", "with known_sig_prop"]
 )
 def test_significant_properties(
-    xsd_schema, duplicate_bag, sig_prop_valid, testing_config, known_sig_prop
+    validators, duplicate_bag, sig_prop_valid, testing_config, known_sig_prop
 ):
     """
     Test basic validation with `SignificantPropertiesPlugin` with a valid IP.
     """
 
     # copy valid sig_props into 'duplicate_bag'
-    copyfile(
-        sig_prop_valid,
+    target = (
         duplicate_bag
         / testing_config.META_DIRECTORY
         / testing_config.SIGNIFICANT_PROPERTIES
     )
+    target.unlink(missing_ok=True)
+    copyfile(sig_prop_valid, target)
 
-    # setup validator
-    validator = SignificantPropertiesPlugin(
-        xml_path=(
-            testing_config.META_DIRECTORY
-            / testing_config.SIGNIFICANT_PROPERTIES
-        ),
-        schema=xsd_schema,
-        known_sig_prop=(
-            testing_config.VALIDATION_SIGPROP_KNOWN_TYPES
-            if known_sig_prop is not None
-            else None
-        ),
-    )
-    result = validator.get(None, path=str(duplicate_bag))
+    result = validators[known_sig_prop].get(None, path=str(duplicate_bag))
     assert result.success
     assert result.valid
     assert Context.WARNING in result.log
@@ -92,7 +134,7 @@ def test_significant_properties(
 
 
 def test_significant_properties_invalid(
-    xsd_schema, duplicate_bag, sig_prop_invalid, testing_config
+    validator, duplicate_bag, sig_prop_invalid, testing_config
 ):
     """
     Test basic validation with `SignificantPropertiesPlugin`
@@ -100,22 +142,14 @@ def test_significant_properties_invalid(
     """
 
     # copy invalid sig_props into 'duplicate_bag'
-    copyfile(
-        sig_prop_invalid,
+    target = (
         duplicate_bag
         / testing_config.META_DIRECTORY
         / testing_config.SIGNIFICANT_PROPERTIES
     )
+    target.unlink(missing_ok=True)
+    copyfile(sig_prop_invalid, target)
 
-    # setup validator
-    validator = SignificantPropertiesPlugin(
-        xml_path=(
-            testing_config.META_DIRECTORY
-            / testing_config.SIGNIFICANT_PROPERTIES
-        ),
-        schema=xsd_schema,
-        known_sig_prop=testing_config.VALIDATION_SIGPROP_KNOWN_TYPES,
-    )
     result = validator.get(None, path=str(duplicate_bag))
     assert result.success
     assert result.valid is False
@@ -128,7 +162,7 @@ def test_significant_properties_invalid(
 
 
 def test_significant_properties_corrupt(
-    xsd_schema, duplicate_bag, sig_prop_corrupt, testing_config
+    validator, duplicate_bag, sig_prop_corrupt, testing_config
 ):
     """
     Test basic validation with `SignificantPropertiesPlugin`
@@ -136,22 +170,14 @@ def test_significant_properties_corrupt(
     """
 
     # copy corrupted sig_props into 'duplicate_bag'
-    copyfile(
-        sig_prop_corrupt,
+    target = (
         duplicate_bag
         / testing_config.META_DIRECTORY
         / testing_config.SIGNIFICANT_PROPERTIES
     )
+    target.unlink(missing_ok=True)
+    copyfile(sig_prop_corrupt, target)
 
-    # setup validator
-    validator = SignificantPropertiesPlugin(
-        xml_path=(
-            testing_config.META_DIRECTORY
-            / testing_config.SIGNIFICANT_PROPERTIES
-        ),
-        schema=xsd_schema,
-        known_sig_prop=testing_config.VALIDATION_SIGPROP_KNOWN_TYPES,
-    )
     result = validator.get(None, path=str(duplicate_bag))
     assert result.success is False
     assert result.valid is None
@@ -2,7 +2,7 @@
 Test module for the package `dcm-ip-builder-sdk`.
 """
 
-from time import sleep
+from time import sleep, monotonic
 
 import pytest
 import dcm_ip_builder_sdk
@@ -10,37 +10,52 @@ import dcm_ip_builder_sdk
 from dcm_ip_builder import app_factory
 
 
-@pytest.fixture(name="app")
-def _app(testing_config):
-    testing_config.ORCHESTRATION_AT_STARTUP = True
-    return app_factory(testing_config(), as_process=True)
+def _wait_for_report(
+    get_report,
+    token: str,
+    initial: float = 0.05,
+    cap: float = 1.0,
+    timeout: float = 60.0,
+):
+    """
+    Polls `get_report` until the report for `token` is available. The
+    interval between requests starts at `initial` and doubles up to
+    `cap` seconds. Gives up after `timeout` seconds.
+    """
+    deadline = monotonic() + timeout
+    delay = initial
+    while True:
+        try:
+            return get_report(token=token)
+        except dcm_ip_builder_sdk.exceptions.ApiException as e:
+            assert e.status == 503
+            if monotonic() > deadline:
+                raise
+            sleep(delay)
+            delay = min(cap, 2 * delay)
+
+
+@pytest.fixture(name="api_client", scope="module")
+def _api_client():
+    with dcm_ip_builder_sdk.ApiClient(
+        dcm_ip_builder_sdk.Configuration(host="http://localhost:8080")
+    ) as api_client:
+        yield api_client
 
 
 @pytest.fixture(name="default_sdk", scope="module")
-def _default_sdk():
-    return dcm_ip_builder_sdk.DefaultApi(
-        dcm_ip_builder_sdk.ApiClient(
-            dcm_ip_builder_sdk.Configuration(host="http://localhost:8080")
-        )
-    )
+def _default_sdk(api_client):
+    return dcm_ip_builder_sdk.DefaultApi(api_client)
 
 
 @pytest.fixture(name="build_sdk", scope="module")
-def _build_sdk():
-    return dcm_ip_builder_sdk.BuildApi(
-        dcm_ip_builder_sdk.ApiClient(
-            dcm_ip_builder_sdk.Configuration(host="http://localhost:8080")
-        )
-    )
+def _build_sdk(api_client):
+    return dcm_ip_builder_sdk.BuildApi(api_client)
 
 
 @pytest.fixture(name="validation_sdk", scope="module")
-def _validation_sdk():
-    return dcm_ip_builder_sdk.ValidationApi(
-        dcm_ip_builder_sdk.ApiClient(
-            dcm_ip_builder_sdk.Configuration(host="http://localhost:8080")
-        )
-    )
+def _validation_sdk(api_client):
+    return dcm_ip_builder_sdk.ValidationApi(api_client)
 
 
 def test_default_ping(
@@ -116,13 +131,7 @@ def test_build_report(
         }
     )
 
-    while True:
-        try:
-            report = build_sdk.get_report(token=submission.value)
-            break
-        except dcm_ip_builder_sdk.exceptions.ApiException as e:
-            assert e.status == 503
-            sleep(2)
+    report = _wait_for_report(build_sdk.get_report, submission.value)
 
     assert report.data.actual_instance.success
     assert (
@@ -158,13 +167,7 @@ def test_build_wo_validate_report(
         }
     )
 
-    while True:
-        try:
-            report = build_sdk.get_report(token=submission.value)
-            break
-        except dcm_ip_builder_sdk.exceptions.ApiException as e:
-            assert e.status == 503
-            sleep(2)
+    report = _wait_for_report(build_sdk.get_report, submission.value)
 
     assert report.data.actual_instance.success
     assert (
@@ -190,13 +193,7 @@ def test_validation_report(
         {"validation": {"target": {"path": str("test-bag")}}}
     )
 
-    while True:
-        try:
-            report = validation_sdk.get_report(token=submission.value)
-            break
-        except dcm_ip_builder_sdk.exceptions.ApiException as e:
-            assert e.status == 503
-            sleep(2)
+    report = _wait_for_report(validation_sdk.get_report, submission.value)
 
     assert report.data.actual_instance.success
     assert report.data.actual_instance.valid
@@ -1,12 +1,12 @@
 """Test-module for build-endpoint."""
 
+import os
 from pathlib import Path
 from shutil import copytree
 from uuid import uuid4
 
 import pytest
 from lxml import etree as et
-from dcm_common.util import list_directory_content
 
 from dcm_ip_builder import app_factory
 from dcm_ip_builder.components import Bag
@@ -120,9 +120,8 @@ def test_build_missing_meta(
     # directory for fs-hook exists but is empty
     assert "path" in report["data"]
     assert (file_storage / report["data"]["path"]).exists()
-    assert (
-        len(list_directory_content(file_storage / report["data"]["path"])) == 0
-    )
+    with os.scandir(file_storage / report["data"]["path"]) as it:
+        assert next(it, None) is None
 
 
 @pytest.mark.parametrize(
@@ -166,12 +165,21 @@ def test_build_dc_xml(ie, dcxml_exists, testing_config, minimal_request_body):
             "meta/dc.xml" in output_bag.tag_manifests[tag]
             for tag in output_bag.tag_manifests
         )
-        parser = et.XMLParser(remove_blank_text=True)
-        src_tree = et.parse(dcxml, parser)
-        title = src_tree.find(".//{http://purl.org/dc/elements/1.1/}title")
-        creator = src_tree.find(".//{http://purl.org/dc/elements/1.1/}creator")
-        assert title.text == "Some title"
-        assert creator.text == "Max Muster, et al."
+        # collect first title/creator while streaming through dc.xml
+        dc_values = {}
+        for _, element in et.iterparse(
+            str(dcxml),
+            events=("end",),
+            tag=(
+                "{http://purl.org/dc/elements/1.1/}title",
+                "{http://purl.org/dc/elements/1.1/}creator",
+            ),
+        ):
+            dc_values.setdefault(et.QName(element).localname, element.text)
+            if len(dc_values) == 2:
+                break
+        assert dc_values.get("title") == "Some title"
+        assert dc_values.get("creator") == "Max Muster, et al."
         assert report["data"]["success"]
         assert report["data"]["valid"]
     else:
@@ -200,12 +208,9 @@ def test_build_no_payload(
     client = app.test_client()
 
     # Remove payload
-    for payload_file in list_directory_content(
-        duplicate_ie / "data",
-        pattern="**/*",
-        condition_function=lambda p: p.is_file(),
-    ):
-        payload_file.unlink()
+    for root, _, files in os.walk(duplicate_ie / "data"):
+        for payload_file in files:
+            os.unlink(os.path.join(root, payload_file))
 
     # submit job
     minimal_request_body["build"]["target"]["path"] = str(